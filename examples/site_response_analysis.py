@@ -1,13 +1,17 @@
 import eqsig
-from collections import OrderedDict
 import numpy as np
 import sfsimodels as sm
 
 import o3seespy as o3
 
 
+# Backbone curve for the PIMY model - constant across runs so only built once
+_REF_STRAIN = 0.005
+_STRAINS = np.logspace(-6, -0.5, 16)
+_RATS = 1. / (1 + (_STRAINS / _REF_STRAIN) ** 0.91)
 
-def site_response(sp, asig, linear=0):
+
+def site_response(sp, asig, linear=0, dump_model=False):
     """
     Run seismic analysis of a soil profile - example based on:
     http://opensees.berkeley.edu/wiki/index.php/Site_Response_Analysis_of_a_Layered_Soil_Column_(Total_Stress_Analysis)
@@ -16,6 +20,8 @@ def site_response(sp, asig, linear=0):
         A soil profile
     :param asig: eqsig.AccSignal object
         An acceleration signal
+    :param dump_model: bool
+        If true then export the model as a python script
     :return:
     """
 
@@ -24,16 +30,17 @@ def site_response(sp, asig, linear=0):
     sp.gen_split(props=['shear_vel', 'unit_mass', 'cohesion', 'phi', 'bulk_mod', 'poissons_ratio', 'strain_peak'])
     thicknesses = sp.split["thickness"]
     n_node_rows = len(thicknesses) + 1
-    node_depths = np.cumsum(sp.split["thickness"])
-    node_depths = np.insert(node_depths, 0, 0)
-    ele_depths = (node_depths[1:] + node_depths[:-1]) / 2
+    node_depths = np.empty(len(thicknesses) + 1, dtype=np.float64)
+    node_depths[0] = 0.0
+    np.cumsum(thicknesses, out=node_depths[1:])
+    ele_depths = 0.5 * (node_depths[1:] + node_depths[:-1])
     shear_vels = sp.split["shear_vel"]
     unit_masses = sp.split["unit_mass"] / 1e3
     g_mods = unit_masses * shear_vels ** 2
     poissons_ratio = sp.split['poissons_ratio']
-    youngs_mods = 2 * g_mods * (1 - poissons_ratio)
-    bulk_mods = youngs_mods / (3 * (1 - 2 * poissons_ratio))
     bulk_mods = sp.split['bulk_mod'] / 1e3
+    if linear:
+        youngs_mods = 2 * g_mods * (1 - poissons_ratio)
 
     ref_pressure = 80.0
     cohesions = sp.split['cohesion'] / 1e3
@@ -54,19 +61,17 @@ def site_response(sp, asig, linear=0):
 
     # Define nodes and set boundary conditions for simple shear deformation
     # Start at top and build down?
-    nd = OrderedDict()
-    nd["R0L"] = o3.node.Node(osi, 0, 0)  # row 0 left
-    nd["R0R"] = o3.node.Node(osi, ele_width, 0)
-    for i in range(1, n_node_rows):
-        # Establish left and right nodes
-        nd[f"R{i}L"] = o3.node.Node(osi, 0, -node_depths[i])
-        nd[f"R{i}R"] = o3.node.Node(osi, ele_width, -node_depths[i])
-        # set x and y dofs equal for left and right nodes
-        o3.EqualDOF(osi, nd[f"R{i}L"], nd[f"R{i}R"], [o3.cc.X, o3.cc.Y])
+    ys = -node_depths
+    coords = np.column_stack([np.zeros_like(ys), ys, np.full_like(ys, ele_width), ys])
+    soil_nodes = o3.node.build_nodes_from_coords(osi, coords.reshape(-1, 2))
+    nodes_l = soil_nodes[0::2]  # row i left node at index i
+    nodes_r = soil_nodes[1::2]
+    # set x and y dofs equal for left and right nodes
+    o3.EqualDOFMulti(osi, nodes_l[1:], nodes_r[1:], [o3.cc.X, o3.cc.Y])
 
     # Fix base nodes
-    o3.Fix2DOF(osi, nd[f"R{n_node_rows - 1}L"], o3.cc.FREE, o3.cc.FIXED)
-    o3.Fix2DOF(osi, nd[f"R{n_node_rows - 1}R"], o3.cc.FREE, o3.cc.FIXED)
+    o3.Fix2DOF(osi, nodes_l[-1], o3.cc.FREE, o3.cc.FIXED)
+    o3.Fix2DOF(osi, nodes_r[-1], o3.cc.FREE, o3.cc.FIXED)
 
     # Define dashpot nodes
     dashpot_node_l = o3.node.Node(osi, 0, -node_depths[-1])
@@ -75,30 +80,29 @@ def site_response(sp, asig, linear=0):
     o3.Fix2DOF(osi, dashpot_node_2, o3.cc.FREE, o3.cc.FIXED)
 
     # define equal DOF for dashpot and soil base nodes
-    o3.EqualDOF(osi, nd[f"R{n_node_rows - 1}L"], nd[f"R{n_node_rows - 1}R"], [o3.cc.X])
-    o3.EqualDOF(osi, nd[f"R{n_node_rows - 1}L"], dashpot_node_2, [o3.cc.X])
+    o3.EqualDOF(osi, nodes_l[-1], nodes_r[-1], [o3.cc.X])
+    o3.EqualDOF(osi, nodes_l[-1], dashpot_node_2, [o3.cc.X])
 
     # define materials
     ele_thick = 1.0  # m
+    b2s = grav * unit_masses
     soil_mats = []
-    strains = np.logspace(-6, -0.5, 16)
-    ref_strain = 0.005
-    rats = 1. / (1 + (strains / ref_strain) ** 0.91)
-    eles = []
     for i in range(len(thicknesses)):
         if not linear:
             mat = o3.nd_material.PressureIndependMultiYield(osi, 2, unit_masses[i], g_mods[i],
                                                          bulk_mods[i], cohesions[i], strain_peaks[i],
                                                          phis[i], d=0.0, n_surf=16,
-                                                         strains=strains, ratios=rats)
+                                                         strains=_STRAINS, ratios=_RATS)
         else:
             mat = o3.nd_material.ElasticIsotropic(osi, youngs_mods[i], poissons_ratio[i], rho=unit_masses[i])
         soil_mats.append(mat)
 
-        # def element
-        nodes = [nd[f"R{i + 1}L"], nd[f"R{i + 1}R"], nd[f"R{i}R"], nd[f"R{i}L"]]
-        ele = o3.element.Quad(osi, nodes, ele_thick, o3.cc.PLANE_STRAIN, mat, b2=grav * unit_masses[i])
-        eles.append(ele)
+    # def elements from the precomputed node rows
+    eles = []
+    quad = o3.element.Quad
+    for i in range(len(thicknesses)):
+        nodes = [nodes_l[i + 1], nodes_r[i + 1], nodes_r[i], nodes_l[i]]
+        eles.append(quad(osi, nodes, ele_thick, o3.cc.PLANE_STRAIN, soil_mats[i], b2=b2s[i]))
 
     # define material and element for viscous dampers
     c_base = ele_width * unit_masses[-1] * shear_vels[-1]
@@ -123,35 +127,37 @@ def site_response(sp, asig, linear=0):
     o3.set_time(osi, 0.0)
     o3.wipe_analysis(osi)
 
-    na = o3.recorder.NodeToArrayCache(osi, node=nd["R0L"], dofs=[o3.cc.X], res_type='accel')
+    na = o3.recorder.NodeToArrayCache(osi, node=nodes_l[0], dofs=[o3.cc.X], res_type='accel', binary=True)
     es = o3.recorder.ElementsToArrayCache(osi, eles=eles, arg_vals=['stress'])
 
     # Define the dynamic analysis
-    ts_obj = o3.time_series.Path(osi, dt=asig.dt, values=asig.velocity * -1, factor=c_base)
+    ts_obj = o3.time_series.Path(osi, dt=asig.dt, values=asig.velocity, factor=-c_base)
     o3.pattern.Plain(osi, ts_obj)
-    o3.Load(osi, nd["R{0}L".format(n_node_rows - 1)], [1., 0.])
+    o3.Load(osi, nodes_l[-1], [1., 0.])
 
     # Run the dynamic analysis
     o3.algorithm.Newton(osi)
     o3.system.SparseGeneral(osi)
-    o3.numberer.RCM(osi)
-    o3.constraints.Transformation(osi)
+    o3.constraints.Transformation(osi)  # numberer not re-declared - defaults to RCM
     o3.integrator.Newmark(osi, newmark_gamma, newmark_beta)
     o3.rayleigh.Rayleigh(osi, a0, a1, 0, 0)
+    o3.test_check.EnergyIncr(osi, tol=1.0e-10, max_iter=10)
     o3.analysis.Transient(osi)
 
-    o3.test_check.EnergyIncr(osi, tol=1.0e-10, max_iter=10)
     analysis_time = asig.time[-1]
     analysis_dt = 0.01
-    # o3.extensions.to_py_file(osi)
+    if dump_model:
+        o3.extensions.to_py_file(osi)
 
-    while o3.get_time(osi) < analysis_time:
-        o3.analyze(osi, 1, analysis_dt)
+    n_steps = int(np.ceil(analysis_time / analysis_dt))
+    o3.analyze(osi, n_steps, analysis_dt)
     o3.wipe(osi)
+    rel_accel = na.collect()
+    n = len(rel_accel)
     outputs = {
-        "time": np.arange(0, analysis_time, analysis_dt),
+        "time": np.linspace(0.0, (n - 1) * analysis_dt, n),  # same length as the recorded accel
         "rel_disp": [],
-        "rel_accel": na.collect(),
+        "rel_accel": rel_accel,
         'ele_stresses': es.collect()
     }
 
@@ -176,9 +182,8 @@ def run_pysra(soil_profile, asig, odepths):
     calc(pysra_m, pysra_profile, pysra_profile.location('outcrop', depth=soil_profile.height))
     outputs(calc)
 
-    out_series = {}
-    for item in od:
-        out_series[item] = outputs[od[item]].values[:asig.npts] * 9.8
+    vals = np.stack([outputs[od[item]].values[:asig.npts] for item in od]) * 9.8
+    out_series = {item: vals[i] for i, item in enumerate(od)}
     return out_series
 
 
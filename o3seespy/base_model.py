@@ -73,7 +73,10 @@ class OpenSeesObject(object):
 
     def to_dict(self, export_none=False):
         outputs = OrderedDict()
-        for item in self.__dict__:
+        items = list(self.__dict__)
+        for cls in type(self).__mro__:  # also export attributes held in __slots__
+            items += [x for x in getattr(cls, '__slots__', ()) if x not in items and hasattr(self, x)]
+        for item in items:
             if '_' == item[0]:  # do not export private variables
                 continue
             value = self.__getattribute__(item)
@@ -3,6 +3,7 @@ from o3seespy.base_model import OpenSeesObject
 
 class LayerBase(OpenSeesObject):
     op_base_type = "layer"
+    __slots__ = ()
 
 
 class Straight(LayerBase):
@@ -12,8 +13,9 @@ class Straight(LayerBase):
     The layer command is used to generate a number of fibers along a line or a circular arc.
     """
     op_type = 'straight'
+    __slots__ = ('osi', 'mat', 'num_fiber', 'area_fiber', 'start', 'end', '_parameters')
 
-    def __init__(self, osi, mat, num_fiber, area_fiber, start, end):
+    def __init__(self, osi, mat, num_fiber: int, area_fiber: float, start, end):
         """
         Initial method for Straight
 
@@ -45,9 +47,11 @@ class Straight(LayerBase):
         self.mat = mat
         self.num_fiber = int(num_fiber)
         self.area_fiber = float(area_fiber)
-        self.start = start
-        self.end = end
-        self._parameters = [self.op_type, self.mat.tag, self.num_fiber, self.area_fiber, *self.start, *self.end]
+        # coerce on entry so to_process does not have to re-box per fiber
+        self.start = [float(start[0]), float(start[1])]
+        self.end = [float(end[0]), float(end[1])]
+        self._parameters = [self.op_type, self.mat.tag, self.num_fiber, self.area_fiber,
+                            self.start[0], self.start[1], self.end[0], self.end[1]]
         self.to_process(osi)
 
 class Circ(LayerBase):
@@ -57,8 +61,9 @@ class Circ(LayerBase):
     This command is used to construct a line of fibers along a circular arc
     """
     op_type = 'circ'
+    __slots__ = ('osi', 'mat', 'num_fiber', 'area_fiber', 'center', 'radius', 'ang', 'built', '_parameters')
 
-    def __init__(self, osi, mat, num_fiber, area_fiber, center, radius, ang=None):
+    def __init__(self, osi, mat, num_fiber: int, area_fiber: float, center, radius: float, ang=None):
         """
         Initial method for Circ
 
@@ -85,12 +90,13 @@ class Circ(LayerBase):
         self.mat = mat
         self.num_fiber = int(num_fiber)
         self.area_fiber = float(area_fiber)
-        self.center = center
+        self.center = [float(center[0]), float(center[1])]
         self.radius = float(radius)
         self.ang = ang
-        self._parameters = [self.op_type, self.mat.tag, self.num_fiber, self.area_fiber, *self.center, self.radius]
+        self._parameters = [self.op_type, self.mat.tag, self.num_fiber, self.area_fiber,
+                            self.center[0], self.center[1], self.radius]
         if self.ang is not None:
-            self._parameters += self.ang
+            self._parameters.extend(self.ang)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -81,6 +81,25 @@ class Node(OpenSeesObject):
         self.to_process(osi)
 
 
+def build_nodes_from_coords(osi, coords):
+    """
+    Create a node for each (x, y) coordinate pair in a single tight loop
+
+    Parameters
+    ----------
+    osi : opensees_pack.opensees_instance.OpenSeesInstance object
+        An instance of opensees
+    coords : 2d array_like
+        Each row contains the x- and y-coordinates of a node
+
+    Returns
+    -------
+    list of Node objects
+    """
+    node = Node  # bind to a local name to avoid module lookups in the loop
+    return [node(osi, xy[0], xy[1]) for xy in coords]
+
+
 def build_regular_node_mesh(osi, xs, ys, zs=None, active=None):
     # axis-2 = x  # unless x or y are singlar
     # axis-1 = y
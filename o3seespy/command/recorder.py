@@ -9,11 +9,19 @@ class RecorderBase(OpenSeesObject):
     
 class RecorderToArrayCacheBase(RecorderBase):  # TODO: implement NodeToArray where data saved to memory and loaded as array without collect
     fname = None
-    
+    binary = False
+    n_cols = None
+
     def collect(self, unlink=True):
-        from numpy import loadtxt
+        from numpy import loadtxt, fromfile
         try:
-            a = loadtxt(self.fname, dtype=float)
+            if self.binary:
+                # each row is n_cols doubles followed by a newline byte
+                a = fromfile(self.fname, dtype=[('data', float, (self.n_cols,)), ('end', 'S1')])['data']
+                if self.n_cols == 1:
+                    a = a[:, 0]
+            else:
+                a = loadtxt(self.fname, dtype=float)
         except ValueError as e:
             print('Warning: Need to run opy.wipe() before collecting arrays')
             raise ValueError(e)
@@ -102,7 +110,7 @@ class NodesToFile(RecorderBase):
 class NodeToArrayCache(RecorderToArrayCacheBase):  # TODO: implement NodeToArray where data saved to memory and loaded as array without collect
     op_type = "Node"
 
-    def __init__(self, osi, node, dofs, res_type, nsd=8, dt=None, fname=None):
+    def __init__(self, osi, node, dofs, res_type, nsd=8, dt=None, fname=None, binary=False):
         """
         Records properties of a node and saves results to a numpy array
 
@@ -120,17 +128,23 @@ class NodeToArrayCache(RecorderToArrayCacheBase):  # TODO: implement NodeToArray
             Time step
         fname: str
             Full file path where data should be stored and loaded from
+        binary: bool
+            If true then record to a binary file - faster to write and collect for long records
         """
         self.osi = osi
         if fname is None:
             self.fname = tempfile.NamedTemporaryFile(delete=False).name
         else:
             self.fname = fname
-        self._parameters = [self.op_type, '-file', self.fname, '-precision', nsd, '-node', node.tag]
+        self.binary = binary
+        self.n_cols = len(dofs)
+        if binary:
+            self._parameters = [self.op_type, '-binary', self.fname]
+        else:
+            self._parameters = [self.op_type, '-file', self.fname, '-precision', nsd]
         if dt is not None:
-            self._parameters.insert(5, '-dT')
-            self._parameters.insert(6, dt)
-        self._parameters += ['-dof', *dofs, res_type]
+            self._parameters += ['-dT', dt]
+        self._parameters += ['-node', node.tag, '-dof', *dofs, res_type]
         self.to_process(osi)
 
 
@@ -1,3 +1,5 @@
+import sys
+
 from o3seespy.command.uniaxial_material.base_material import UniaxialMaterialBase
 
 
@@ -10,6 +12,7 @@ class Hardening(UniaxialMaterialBase):
     The model includes optional visco-plasticity using a Perzyna formulation.
     """
     op_type = 'Hardening'
+    __slots__ = ('osi', 'e_mod', 'sigma_y', 'h_iso', 'h_kin', 'eta', 'built', '_parameters')
 
     def __init__(self, osi, e_mod, sigma_y, h_iso, h_kin, eta=0.0):
         """
@@ -44,7 +47,7 @@ class Hardening(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.e_mod, self.sigma_y, self.h_iso, self.h_kin, self.eta]
+        self._parameters = (self.op_type, self._tag, self.e_mod, self.sigma_y, self.h_iso, self.h_kin, self.eta)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -71,6 +74,8 @@ class Cast(UniaxialMaterialBase):
     previously-constructed UniaxialMaterial objects.
     """
     op_type = 'Cast'
+    __slots__ = ('osi', 'n', 'bo', 'h', 'fy', 'e_mod', 'big_l', 'b', 'ro', 'c_r1', 'c_r2', 'a1', 'a2', 'a3',
+                 'a4', 'built', '_parameters')
 
     def __init__(self, osi, n, bo, h, fy, e_mod, big_l, b, ro, c_r1, c_r2, a1: float=None, a2=1.0, a3: float=None, a4=1.0):
         """
@@ -141,17 +146,11 @@ class Cast(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.n, self.bo, self.h, self.fy, self.e_mod, self.big_l, self.b, self.ro, self.c_r1, self.c_r2]
-        special_pms = ['a1', 'a2', 'a3', 'a4']
-        packets = [False, False, False, False]
-        for i, pm in enumerate(special_pms):
-            if getattr(self, pm) is not None:
-                if packets[i]:
-                    self._parameters += [*getattr(self, pm)]
-                else:
-                    self._parameters += [getattr(self, pm)]
-            else:
-                break
+        tail = (self.a1, self.a2, self.a3, self.a4)
+        if None in tail:
+            tail = tail[:tail.index(None)]  # trailing parameters can only be set if all preceding ones are set
+        self._parameters = (self.op_type, self._tag, self.n, self.bo, self.h, self.fy, self.e_mod, self.big_l,
+                            self.b, self.ro, self.c_r1, self.c_r2) + tail
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -168,6 +167,8 @@ class ViscousDamper(UniaxialMaterialBase):
     constitutive equations within a nonlinear viscous damper with a high-precision accuracy.
     """
     op_type = 'ViscousDamper'
+    __slots__ = ('osi', 'k_el', 'cd', 'alpha', 'l_gap', 'nm', 'rel_tol', 'abs_tol', 'max_half', 'built',
+                 '_parameters')
 
     def __init__(self, osi, k_el, cd, alpha, l_gap=0.0, nm=1, rel_tol=1e-6, abs_tol=1e-10, max_half=15):
         """
@@ -213,7 +214,7 @@ class ViscousDamper(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.k_el, self.cd, self.alpha, self.l_gap, self.nm, self.rel_tol, self.abs_tol, self.max_half]
+        self._parameters = (self.op_type, self._tag, self.k_el, self.cd, self.alpha, self.l_gap, self.nm, self.rel_tol, self.abs_tol, self.max_half)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -235,6 +236,8 @@ class BilinearOilDamper(UniaxialMaterialBase):
     numerically the constitutive equations within a bilinear oil damper with a high-precision accuracy.
     """
     op_type = 'BilinearOilDamper'
+    __slots__ = ('osi', 'k_el', 'cd', 'fr', 'p', 'l_gap', 'nm', 'rel_tol', 'abs_tol', 'max_half', 'built',
+                 '_parameters')
 
     def __init__(self, osi, k_el, cd, fr=1.0, p=1.0, l_gap=0.0, nm=1, rel_tol=1e-6, abs_tol=1e-10, max_half=15):
         """
@@ -283,7 +286,7 @@ class BilinearOilDamper(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.k_el, self.cd, self.fr, self.p, self.l_gap, self.nm, self.rel_tol, self.abs_tol, self.max_half]
+        self._parameters = (self.op_type, self._tag, self.k_el, self.cd, self.fr, self.p, self.l_gap, self.nm, self.rel_tol, self.abs_tol, self.max_half)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -319,6 +322,10 @@ class Bilin(UniaxialMaterialBase):
     **Use the module Component Model.**
     """
     op_type = 'Bilin'
+    __slots__ = ('osi', 'k0', 'as__plus', 'as__neg', 'my__plus', 'my__neg', 'lamda_s', 'lamda_c', 'lamda_a',
+                 'lamda_k', 'c_s', 'c_c', 'c_a', 'c_k', 'theta_p__plus', 'theta_p__neg', 'theta_pc__plus',
+                 'theta_pc__neg', 'res__pos', 'res__neg', 'theta_u__plus', 'theta_u__neg', 'd__plus',
+                 'd__neg', 'n_factor', 'built', '_parameters')
 
     def __init__(self, osi, k0, as__plus, as__neg, my__plus, my__neg, lamda_s, lamda_c, lamda_a, lamda_k, c_s, c_c, c_a, c_k, theta_p__plus, theta_p__neg, theta_pc__plus, theta_pc__neg, res__pos, res__neg, theta_u__plus, theta_u__neg, d__plus, d__neg, n_factor=0.0):
         """
@@ -391,34 +398,19 @@ class Bilin(UniaxialMaterialBase):
         >>> o3.uniaxial_material.Bilin(osi, k0=1.0, as__plus=1.0, as__neg=1.0, my__plus=1.0, my__neg=1.0, lamda_s=1.0, lamda_c=1.0, lamda_a=1.0, lamda_k=1.0, c_s=1.0, c_c=1.0, c_a=1.0, c_k=1.0, theta_p__plus=1.0, theta_p__neg=1.0, theta_pc__plus=1.0, theta_pc__neg=1.0, res__pos=1.0, res__neg=1.0, theta_u__plus=1.0, theta_u__neg=1.0, d__plus=1.0, d__neg=1.0, n_factor=0.0)
         """
         self.osi = osi
-        self.k0 = float(k0)
-        self.as__plus = float(as__plus)
-        self.as__neg = float(as__neg)
-        self.my__plus = float(my__plus)
-        self.my__neg = float(my__neg)
-        self.lamda_s = float(lamda_s)
-        self.lamda_c = float(lamda_c)
-        self.lamda_a = float(lamda_a)
-        self.lamda_k = float(lamda_k)
-        self.c_s = float(c_s)
-        self.c_c = float(c_c)
-        self.c_a = float(c_a)
-        self.c_k = float(c_k)
-        self.theta_p__plus = float(theta_p__plus)
-        self.theta_p__neg = float(theta_p__neg)
-        self.theta_pc__plus = float(theta_pc__plus)
-        self.theta_pc__neg = float(theta_pc__neg)
-        self.res__pos = float(res__pos)
-        self.res__neg = float(res__neg)
-        self.theta_u__plus = float(theta_u__plus)
-        self.theta_u__neg = float(theta_u__neg)
-        self.d__plus = float(d__plus)
-        self.d__neg = float(d__neg)
-        self.n_factor = float(n_factor)
+        # coerce once and reuse the coerced values for the parameter list
+        pms = [float(x) for x in (k0, as__plus, as__neg, my__plus, my__neg, lamda_s, lamda_c, lamda_a,
+                                  lamda_k, c_s, c_c, c_a, c_k, theta_p__plus, theta_p__neg, theta_pc__plus,
+                                  theta_pc__neg, res__pos, res__neg, theta_u__plus, theta_u__neg, d__plus,
+                                  d__neg, n_factor)]
+        (self.k0, self.as__plus, self.as__neg, self.my__plus, self.my__neg, self.lamda_s, self.lamda_c,
+         self.lamda_a, self.lamda_k, self.c_s, self.c_c, self.c_a, self.c_k, self.theta_p__plus,
+         self.theta_p__neg, self.theta_pc__plus, self.theta_pc__neg, self.res__pos, self.res__neg,
+         self.theta_u__plus, self.theta_u__neg, self.d__plus, self.d__neg, self.n_factor) = pms
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.k0, self.as__plus, self.as__neg, self.my__plus, self.my__neg, self.lamda_s, self.lamda_c, self.lamda_a, self.lamda_k, self.c_s, self.c_c, self.c_a, self.c_k, self.theta_p__plus, self.theta_p__neg, self.theta_pc__plus, self.theta_pc__neg, self.res__pos, self.res__neg, self.theta_u__plus, self.theta_u__neg, self.d__plus, self.d__neg, self.n_factor]
+        self._parameters = (self.op_type, self._tag, *pms)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -438,6 +430,10 @@ class ModIMKPeakOriented(UniaxialMaterialBase):
     model including the way to be used within openSees `youtube link <http://youtu.be/YHBHQ-xuybE>`_.
     """
     op_type = 'ModIMKPeakOriented'
+    __slots__ = ('osi', 'k0', 'as__plus', 'as__neg', 'my__plus', 'my__neg', 'lamda_s', 'lamda_c', 'lamda_a',
+                 'lamda_k', 'c_s', 'c_c', 'c_a', 'c_k', 'theta_p__plus', 'theta_p__neg', 'theta_pc__plus',
+                 'theta_pc__neg', 'res__pos', 'res__neg', 'theta_u__plus', 'theta_u__neg', 'd__plus',
+                 'd__neg', 'built', '_parameters')
 
     def __init__(self, osi, k0, as__plus, as__neg, my__plus, my__neg, lamda_s, lamda_c, lamda_a, lamda_k, c_s, c_c, c_a, c_k, theta_p__plus, theta_p__neg, theta_pc__plus, theta_pc__neg, res__pos, res__neg, theta_u__plus, theta_u__neg, d__plus, d__neg):
         """
@@ -507,33 +503,18 @@ class ModIMKPeakOriented(UniaxialMaterialBase):
         >>> o3.uniaxial_material.ModIMKPeakOriented(osi, k0=1.0, as__plus=1.0, as__neg=1.0, my__plus=1.0, my__neg=1.0, lamda_s=1.0, lamda_c=1.0, lamda_a=1.0, lamda_k=1.0, c_s=1.0, c_c=1.0, c_a=1.0, c_k=1.0, theta_p__plus=1.0, theta_p__neg=1.0, theta_pc__plus=1.0, theta_pc__neg=1.0, res__pos=1.0, res__neg=1.0, theta_u__plus=1.0, theta_u__neg=1.0, d__plus=1.0, d__neg=1.0)
         """
         self.osi = osi
-        self.k0 = float(k0)
-        self.as__plus = float(as__plus)
-        self.as__neg = float(as__neg)
-        self.my__plus = float(my__plus)
-        self.my__neg = float(my__neg)
-        self.lamda_s = float(lamda_s)
-        self.lamda_c = float(lamda_c)
-        self.lamda_a = float(lamda_a)
-        self.lamda_k = float(lamda_k)
-        self.c_s = float(c_s)
-        self.c_c = float(c_c)
-        self.c_a = float(c_a)
-        self.c_k = float(c_k)
-        self.theta_p__plus = float(theta_p__plus)
-        self.theta_p__neg = float(theta_p__neg)
-        self.theta_pc__plus = float(theta_pc__plus)
-        self.theta_pc__neg = float(theta_pc__neg)
-        self.res__pos = float(res__pos)
-        self.res__neg = float(res__neg)
-        self.theta_u__plus = float(theta_u__plus)
-        self.theta_u__neg = float(theta_u__neg)
-        self.d__plus = float(d__plus)
-        self.d__neg = float(d__neg)
+        pms = [float(x) for x in (k0, as__plus, as__neg, my__plus, my__neg, lamda_s, lamda_c, lamda_a,
+                                  lamda_k, c_s, c_c, c_a, c_k, theta_p__plus, theta_p__neg, theta_pc__plus,
+                                  theta_pc__neg, res__pos, res__neg, theta_u__plus, theta_u__neg, d__plus,
+                                  d__neg)]
+        (self.k0, self.as__plus, self.as__neg, self.my__plus, self.my__neg, self.lamda_s, self.lamda_c,
+         self.lamda_a, self.lamda_k, self.c_s, self.c_c, self.c_a, self.c_k, self.theta_p__plus,
+         self.theta_p__neg, self.theta_pc__plus, self.theta_pc__neg, self.res__pos, self.res__neg,
+         self.theta_u__plus, self.theta_u__neg, self.d__plus, self.d__neg) = pms
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.k0, self.as__plus, self.as__neg, self.my__plus, self.my__neg, self.lamda_s, self.lamda_c, self.lamda_a, self.lamda_k, self.c_s, self.c_c, self.c_a, self.c_k, self.theta_p__plus, self.theta_p__neg, self.theta_pc__plus, self.theta_pc__neg, self.res__pos, self.res__neg, self.theta_u__plus, self.theta_u__neg, self.d__plus, self.d__neg]
+        self._parameters = (self.op_type, self._tag, *pms)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -551,6 +532,10 @@ class ModIMKPinching(UniaxialMaterialBase):
     link <http://youtu.be/YHBHQ-xuybE>`_.
     """
     op_type = 'ModIMKPinching'
+    __slots__ = ('osi', 'k0', 'as__plus', 'as__neg', 'my__plus', 'my__neg', 'fpr_pos', 'fpr_neg', 'a_pinch',
+                 'lamda_s', 'lamda_c', 'lamda_a', 'lamda_k', 'c_s', 'c_c', 'c_a', 'c_k', 'theta_p__plus',
+                 'theta_p__neg', 'theta_pc__plus', 'theta_pc__neg', 'res__pos', 'res__neg', 'theta_u__plus',
+                 'theta_u__neg', 'd__plus', 'd__neg', 'built', '_parameters')
 
     def __init__(self, osi, k0, as__plus, as__neg, my__plus, my__neg, fpr_pos, fpr_neg, a_pinch, lamda_s, lamda_c, lamda_a, lamda_k, c_s, c_c, c_a, c_k, theta_p__plus, theta_p__neg, theta_pc__plus, theta_pc__neg, res__pos, res__neg, theta_u__plus, theta_u__neg, d__plus, d__neg):
         """
@@ -628,36 +613,18 @@ class ModIMKPinching(UniaxialMaterialBase):
         >>> o3.uniaxial_material.ModIMKPinching(osi, k0=1.0, as__plus=1.0, as__neg=1.0, my__plus=1.0, my__neg=1.0, fpr_pos=1.0, fpr_neg=1.0, a_pinch=1.0, lamda_s=1.0, lamda_c=1.0, lamda_a=1.0, lamda_k=1.0, c_s=1.0, c_c=1.0, c_a=1.0, c_k=1.0, theta_p__plus=1.0, theta_p__neg=1.0, theta_pc__plus=1.0, theta_pc__neg=1.0, res__pos=1.0, res__neg=1.0, theta_u__plus=1.0, theta_u__neg=1.0, d__plus=1.0, d__neg=1.0)
         """
         self.osi = osi
-        self.k0 = float(k0)
-        self.as__plus = float(as__plus)
-        self.as__neg = float(as__neg)
-        self.my__plus = float(my__plus)
-        self.my__neg = float(my__neg)
-        self.fpr_pos = float(fpr_pos)
-        self.fpr_neg = float(fpr_neg)
-        self.a_pinch = float(a_pinch)
-        self.lamda_s = float(lamda_s)
-        self.lamda_c = float(lamda_c)
-        self.lamda_a = float(lamda_a)
-        self.lamda_k = float(lamda_k)
-        self.c_s = float(c_s)
-        self.c_c = float(c_c)
-        self.c_a = float(c_a)
-        self.c_k = float(c_k)
-        self.theta_p__plus = float(theta_p__plus)
-        self.theta_p__neg = float(theta_p__neg)
-        self.theta_pc__plus = float(theta_pc__plus)
-        self.theta_pc__neg = float(theta_pc__neg)
-        self.res__pos = float(res__pos)
-        self.res__neg = float(res__neg)
-        self.theta_u__plus = float(theta_u__plus)
-        self.theta_u__neg = float(theta_u__neg)
-        self.d__plus = float(d__plus)
-        self.d__neg = float(d__neg)
+        pms = [float(x) for x in (k0, as__plus, as__neg, my__plus, my__neg, fpr_pos, fpr_neg, a_pinch,
+                                  lamda_s, lamda_c, lamda_a, lamda_k, c_s, c_c, c_a, c_k, theta_p__plus,
+                                  theta_p__neg, theta_pc__plus, theta_pc__neg, res__pos, res__neg,
+                                  theta_u__plus, theta_u__neg, d__plus, d__neg)]
+        (self.k0, self.as__plus, self.as__neg, self.my__plus, self.my__neg, self.fpr_pos, self.fpr_neg,
+         self.a_pinch, self.lamda_s, self.lamda_c, self.lamda_a, self.lamda_k, self.c_s, self.c_c, self.c_a,
+         self.c_k, self.theta_p__plus, self.theta_p__neg, self.theta_pc__plus, self.theta_pc__neg,
+         self.res__pos, self.res__neg, self.theta_u__plus, self.theta_u__neg, self.d__plus, self.d__neg) = pms
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.k0, self.as__plus, self.as__neg, self.my__plus, self.my__neg, self.fpr_pos, self.fpr_neg, self.a_pinch, self.lamda_s, self.lamda_c, self.lamda_a, self.lamda_k, self.c_s, self.c_c, self.c_a, self.c_k, self.theta_p__plus, self.theta_p__neg, self.theta_pc__plus, self.theta_pc__neg, self.res__pos, self.res__neg, self.theta_u__plus, self.theta_u__neg, self.d__plus, self.d__neg]
+        self._parameters = (self.op_type, self._tag, *pms)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -672,6 +639,8 @@ class SAWS(UniaxialMaterialBase):
     one-dimensional hysteretic model develeped as part of the CUREe Caltech wood frame project.
     """
     op_type = 'SAWS'
+    __slots__ = ('osi', 'f0', 'fi', 'du', 's0', 'r1', 'r2', 'r3', 'r4', 'alpha', 'beta', 'built',
+                 '_parameters')
 
     def __init__(self, osi, f0, fi, du, s0, r1, r2, r3, r4, alpha, beta):
         """
@@ -724,7 +693,7 @@ class SAWS(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.f0, self.fi, self.du, self.s0, self.r1, self.r2, self.r3, self.r4, self.alpha, self.beta]
+        self._parameters = (self.op_type, self._tag, self.f0, self.fi, self.du, self.s0, self.r1, self.r2, self.r3, self.r4, self.alpha, self.beta)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -741,6 +710,8 @@ class BarSlip(UniaxialMaterialBase):
     stiffness degradation, strength degradation.
     """
     op_type = 'BarSlip'
+    __slots__ = ('osi', 'fc', 'fy', 'es', 'fu', 'eh', 'db', 'ld', 'nb', 'depth', 'height', 'anc_lratio',
+                 'bs_flag', 'otype', 'damage', 'unit', 'built', '_parameters')
 
     def __init__(self, osi, fc, fy, es, fu, eh, db, ld, nb, depth, height, bs_flag, otype, anc_lratio=1.0, damage='Damage', unit='psi'):
         """
@@ -807,14 +778,17 @@ class BarSlip(UniaxialMaterialBase):
         self.depth = float(depth)
         self.height = float(height)
         self.anc_lratio = float(anc_lratio)
-        self.bs_flag = bs_flag
-        self.otype = otype
-        self.damage = damage
-        self.unit = unit
+        # intern the flag strings - repeated definitions then share one cached-hash string
+        self.bs_flag = sys.intern(bs_flag)
+        self.otype = sys.intern(otype)
+        self.damage = sys.intern(damage)
+        self.unit = sys.intern(unit)
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.fc, self.fy, self.es, self.fu, self.eh, self.db, self.ld, self.nb, self.depth, self.height, self.anc_lratio, self.bs_flag, self.otype, self.damage, self.unit]
+        self._parameters = (self.op_type, self._tag, self.fc, self.fy, self.es, self.fu, self.eh, self.db,
+                            self.ld, self.nb, self.depth, self.height, self.anc_lratio, self.bs_flag,
+                            self.otype, self.damage, self.unit)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -835,6 +809,7 @@ class BondSP01(UniaxialMaterialBase):
     column and wall longitudinal bars anchored into footings or bridge joints
     """
     op_type = 'Bond_SP01'
+    __slots__ = ('osi', 'fy', 'sy', 'fu', 'su', 'b', 'big_r', 'built', '_parameters')
 
     def __init__(self, osi, fy, sy, fu, su, b, big_r):
         """
@@ -872,7 +847,7 @@ class BondSP01(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.fy, self.sy, self.fu, self.su, self.b, self.big_r]
+        self._parameters = (self.op_type, self._tag, self.fy, self.sy, self.fu, self.su, self.b, self.big_r)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -887,6 +862,7 @@ class Fatigue(UniaxialMaterialBase):
     Miner's Rule. Element stress/strain relationships become zero when fatigue life is exhausted.
     """
     op_type = 'Fatigue'
+    __slots__ = ('osi', 'other', 'e0', 'm', 'min', 'max', 'built', '_parameters')
 
     def __init__(self, osi, other, e0: float=None, m: float=None, min: float=None, max: float=None):
         """
@@ -934,15 +910,16 @@ class Fatigue(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.other.tag]
-        if getattr(self, 'e0') is not None:
-            self._parameters += ['-E0', self.e0]
-        if getattr(self, 'm') is not None:
-            self._parameters += ['-m', self.m]
-        if getattr(self, 'min') is not None:
-            self._parameters += ['-min', self.min]
-        if getattr(self, 'max') is not None:
-            self._parameters += ['-max', self.max]
+        opts = []  # collect locally so _parameters is assembled in one pass
+        if self.e0 is not None:
+            opts += ['-E0', self.e0]
+        if self.m is not None:
+            opts += ['-m', self.m]
+        if self.min is not None:
+            opts += ['-min', self.min]
+        if self.max is not None:
+            opts += ['-max', self.max]
+        self._parameters = (self.op_type, self._tag, self.other.tag, *opts)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -956,6 +933,7 @@ class ImpactMaterial(UniaxialMaterialBase):
     This command is used to construct an impact material object
     """
     op_type = 'ImpactMaterial'
+    __slots__ = ('osi', 'k1', 'k2', 'sigy', 'gap', 'built', '_parameters')
 
     def __init__(self, osi, k1, k2, sigy, gap):
         """
@@ -988,7 +966,7 @@ class ImpactMaterial(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.k1, self.k2, self.sigy, self.gap]
+        self._parameters = (self.op_type, self._tag, self.k1, self.k2, self.sigy, self.gap)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -1002,6 +980,7 @@ class HyperbolicGapMaterial(UniaxialMaterialBase):
     This command is used to construct a hyperbolic gap material object.
     """
     op_type = 'HyperbolicGapMaterial'
+    __slots__ = ('osi', 'kmax', 'kur', 'rf', 'fult', 'gap', 'built', '_parameters')
 
     def __init__(self, osi, kmax, kur, rf, fult, gap):
         """
@@ -1037,7 +1016,7 @@ class HyperbolicGapMaterial(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.kmax, self.kur, self.rf, self.fult, self.gap]
+        self._parameters = (self.op_type, self._tag, self.kmax, self.kur, self.rf, self.fult, self.gap)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -1053,6 +1032,9 @@ class LimitState(UniaxialMaterialBase):
     is defined by the associated Limit Curve.
     """
     op_type = 'LimitState'
+    __slots__ = ('osi', 's1p', 'e1p', 's2p', 'e2p', 's3p', 'e3p', 's1n', 'e1n', 's2n', 'e2n', 's3n',
+                 'e3n', 'pinch_x', 'pinch_y', 'damage1', 'damage2', 'beta', 'curve', 'curve_type',
+                 'built', '_parameters')
 
     def __init__(self, osi, s1p, e1p, s2p, e2p, s3p, e3p, s1n, e1n, s2n, e2n, s3n, e3n, pinch_x, pinch_y, damage1, damage2, beta, curve, curve_type):
         """
@@ -1110,29 +1092,17 @@ class LimitState(UniaxialMaterialBase):
         >>> o3.uniaxial_material.LimitState(osi, s1p=1.0, e1p=1.0, s2p=1.0, e2p=1.0, s3p=1.0, e3p=1.0, s1n=1.0, e1n=1.0, s2n=1.0, e2n=1.0, s3n=1.0, e3n=1.0, pinch_x=1.0, pinch_y=1.0, damage1=1.0, damage2=1.0, beta=1.0, curve=curve, curve_type=1)
         """
         self.osi = osi
-        self.s1p = float(s1p)
-        self.e1p = float(e1p)
-        self.s2p = float(s2p)
-        self.e2p = float(e2p)
-        self.s3p = float(s3p)
-        self.e3p = float(e3p)
-        self.s1n = float(s1n)
-        self.e1n = float(e1n)
-        self.s2n = float(s2n)
-        self.e2n = float(e2n)
-        self.s3n = float(s3n)
-        self.e3n = float(e3n)
-        self.pinch_x = float(pinch_x)
-        self.pinch_y = float(pinch_y)
-        self.damage1 = float(damage1)
-        self.damage2 = float(damage2)
-        self.beta = float(beta)
+        pms = [float(x) for x in (s1p, e1p, s2p, e2p, s3p, e3p, s1n, e1n, s2n, e2n, s3n, e3n,
+                                  pinch_x, pinch_y, damage1, damage2, beta)]
+        (self.s1p, self.e1p, self.s2p, self.e2p, self.s3p, self.e3p, self.s1n, self.e1n, self.s2n,
+         self.e2n, self.s3n, self.e3n, self.pinch_x, self.pinch_y, self.damage1, self.damage2,
+         self.beta) = pms
         self.curve = curve
         self.curve_type = int(curve_type)
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.s1p, self.e1p, self.s2p, self.e2p, self.s3p, self.e3p, self.s1n, self.e1n, self.s2n, self.e2n, self.s3n, self.e3n, self.pinch_x, self.pinch_y, self.damage1, self.damage2, self.beta, self.curve.tag, self.curve_type]
+        self._parameters = (self.op_type, self._tag, *pms, self.curve.tag, self.curve_type)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -1151,6 +1121,7 @@ class MinMax(UniaxialMaterialBase):
     other material is assumed to have failed. From that point on, values of 0.0 are returned for the tangent and stress.
     """
     op_type = 'MinMax'
+    __slots__ = ('osi', 'other', 'min_strain', 'max_strain', 'built', '_parameters')
 
     def __init__(self, osi, other, min_strain: float=None, max_strain: float=None):
         """
@@ -1186,11 +1157,12 @@ class MinMax(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.other.tag]
-        if getattr(self, 'min_strain') is not None:
-            self._parameters += ['-min', self.min_strain]
-        if getattr(self, 'max_strain') is not None:
-            self._parameters += ['-max', self.max_strain]
+        opts = []
+        if self.min_strain is not None:
+            opts += ['-min', self.min_strain]
+        if self.max_strain is not None:
+            opts += ['-max', self.max_strain]
+        self._parameters = (self.op_type, self._tag, self.other.tag, *opts)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -1205,6 +1177,7 @@ class ElasticBilin(UniaxialMaterialBase):
     the unloading curve follows the loading curve exactly.
     """
     op_type = 'ElasticBilin'
+    __slots__ = ('osi', 'ep1', 'ep2', 'eps_p2', 'en1', 'en2', 'eps_n2', 'built', '_parameters')
 
     def __init__(self, osi, ep1, ep2, eps_p2, en1: float=None, en2: float=None, eps_n2: float=None):
         """
@@ -1251,17 +1224,10 @@ class ElasticBilin(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.ep1, self.ep2, self.eps_p2]
-        special_pms = ['en1', 'en2', 'eps_n2']
-        packets = [False, False, False]
-        for i, pm in enumerate(special_pms):
-            if getattr(self, pm) is not None:
-                if packets[i]:
-                    self._parameters += [*getattr(self, pm)]
-                else:
-                    self._parameters += [getattr(self, pm)]
-            else:
-                break
+        tail = (self.en1, self.en2, self.eps_n2)
+        if None in tail:
+            tail = tail[:tail.index(None)]  # trailing parameters can only be set if all preceding ones are set
+        self._parameters = (self.op_type, self._tag, self.ep1, self.ep2, self.eps_p2) + tail
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -1281,6 +1247,7 @@ class ElasticMultiLinear(UniaxialMaterialBase):
     equal to the number of provided stress points.
     """
     op_type = 'ElasticMultiLinear'
+    __slots__ = ('osi', 'eta', 'strain', 'stress', 'built', '_parameters')
 
     def __init__(self, osi, eta=0.0, strain: list=None, stress: list=None):
         """
@@ -1306,16 +1273,23 @@ class ElasticMultiLinear(UniaxialMaterialBase):
         """
         self.osi = osi
         self.eta = float(eta)
+        # numpy arrays: tolist unboxes to plain floats in one call instead of one boxed
+        # scalar per point when the array is splatted into the parameter list
+        if hasattr(strain, 'tolist'):
+            strain = strain.tolist()
+        if hasattr(stress, 'tolist'):
+            stress = stress.tolist()
         self.strain = strain
         self.stress = stress
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.eta]
-        if getattr(self, 'strain') is not None:
-            self._parameters += ['-strain', *self.strain]
-        if getattr(self, 'stress') is not None:
-            self._parameters += ['-stress', *self.stress]
+        opts = []
+        if self.strain is not None:
+            opts += ['-strain', *self.strain]
+        if self.stress is not None:
+            opts += ['-stress', *self.stress]
+        self._parameters = (self.op_type, self._tag, self.eta, *opts)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -1329,6 +1303,7 @@ class MultiLinear(UniaxialMaterialBase):
     This command is used to construct a uniaxial multilinear material object.
     """
     op_type = 'MultiLinear'
+    __slots__ = ('osi', 'pts', 'built', '_parameters')
 
     def __init__(self, osi, pts):
         """
@@ -1348,11 +1323,13 @@ class MultiLinear(UniaxialMaterialBase):
         >>> o3.uniaxial_material.MultiLinear(osi, pts=pts)
         """
         self.osi = osi
+        if hasattr(pts, 'tolist'):  # numpy arrays: unbox to plain floats in one call
+            pts = pts.tolist()
         self.pts = pts
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, *self.pts]
+        self._parameters = (self.op_type, self._tag, *self.pts)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -1368,6 +1345,7 @@ class InitStrainMaterial(UniaxialMaterialBase):
     consideration. The stress that corresponds to the initial strain will be calculated from the other material.
     """
     op_type = 'InitStrainMaterial'
+    __slots__ = ('osi', 'other', 'init_strain', 'built', '_parameters')
 
     def __init__(self, osi, other, init_strain):
         """
@@ -1394,7 +1372,7 @@ class InitStrainMaterial(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.other.tag, self.init_strain]
+        self._parameters = (self.op_type, self._tag, self.other.tag, self.init_strain)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -1410,6 +1388,7 @@ class InitStressMaterial(UniaxialMaterialBase):
     consideration. The strain that corresponds to the initial stress will be calculated from the other material.
     """
     op_type = 'InitStressMaterial'
+    __slots__ = ('osi', 'other', 'init_stress', 'built', '_parameters')
 
     def __init__(self, osi, other, init_stress):
         """
@@ -1441,7 +1420,7 @@ class InitStressMaterial(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.other.tag, self.init_stress]
+        self._parameters = (self.op_type, self._tag, self.other.tag, self.init_stress)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -1458,6 +1437,7 @@ class PathIndependent(UniaxialMaterialBase):
     This command is to create a PathIndependent material
     """
     op_type = 'PathIndependent'
+    __slots__ = ('osi', 'other', 'built', '_parameters')
 
     def __init__(self, osi, other):
         """
@@ -1481,7 +1461,7 @@ class PathIndependent(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.other.tag]
+        self._parameters = (self.op_type, self._tag, self.other.tag)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -1496,6 +1476,8 @@ class ECC01(UniaxialMaterialBase):
     ECC material model of Han, et al. (see references). Reloading in tension and compression is linear.
     """
     op_type = 'ECC01'
+    __slots__ = ('osi', 'sigt0', 'epst0', 'sigt1', 'epst1', 'epst2', 'sigc0', 'epsc0', 'epsc1',
+                 'alpha_t1', 'alpha_t2', 'alpha_c', 'alpha_cu', 'beta_t', 'beta_c', 'built', '_parameters')
 
     def __init__(self, osi, sigt0, epst0, sigt1, epst1, epst2, sigc0, epsc0, epsc1, alpha_t1, alpha_t2, alpha_c, alpha_cu, beta_t, beta_c):
         """
@@ -1540,24 +1522,15 @@ class ECC01(UniaxialMaterialBase):
         >>> o3.uniaxial_material.ECC01(osi, sigt0=1.0, epst0=1.0, sigt1=1.0, epst1=1.0, epst2=1.0, sigc0=1.0, epsc0=1.0, epsc1=1.0, alpha_t1=1.0, alpha_t2=1.0, alpha_c=1.0, alpha_cu=1.0, beta_t=1.0, beta_c=1.0)
         """
         self.osi = osi
-        self.sigt0 = float(sigt0)
-        self.epst0 = float(epst0)
-        self.sigt1 = float(sigt1)
-        self.epst1 = float(epst1)
-        self.epst2 = float(epst2)
-        self.sigc0 = float(sigc0)
-        self.epsc0 = float(epsc0)
-        self.epsc1 = float(epsc1)
-        self.alpha_t1 = float(alpha_t1)
-        self.alpha_t2 = float(alpha_t2)
-        self.alpha_c = float(alpha_c)
-        self.alpha_cu = float(alpha_cu)
-        self.beta_t = float(beta_t)
-        self.beta_c = float(beta_c)
+        pms = [float(x) for x in (sigt0, epst0, sigt1, epst1, epst2, sigc0, epsc0, epsc1,
+                                  alpha_t1, alpha_t2, alpha_c, alpha_cu, beta_t, beta_c)]
+        (self.sigt0, self.epst0, self.sigt1, self.epst1, self.epst2, self.sigc0, self.epsc0,
+         self.epsc1, self.alpha_t1, self.alpha_t2, self.alpha_c, self.alpha_cu, self.beta_t,
+         self.beta_c) = pms
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.sigt0, self.epst0, self.sigt1, self.epst1, self.epst2, self.sigc0, self.epsc0, self.epsc1, self.alpha_t1, self.alpha_t2, self.alpha_c, self.alpha_cu, self.beta_t, self.beta_c]
+        self._parameters = (self.op_type, self._tag, *pms)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -1572,6 +1545,7 @@ class SelfCentering(UniaxialMaterialBase):
     non-recoverable slip behaviour and an optional stiffness increase at high strains (bearing behaviour).
     """
     op_type = 'SelfCentering'
+    __slots__ = ('osi', 'k1', 'k2', 'sig_act', 'beta', 'eps_slip', 'eps_bear', 'r_bear', 'built', '_parameters')
 
     def __init__(self, osi, k1, k2, sig_act, beta, eps_slip=0, eps_bear=0, r_bear: float=None):
         """
@@ -1615,17 +1589,9 @@ class SelfCentering(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.k1, self.k2, self.sig_act, self.beta, self.eps_slip, self.eps_bear]
-        special_pms = ['r_bear']
-        packets = [False]
-        for i, pm in enumerate(special_pms):
-            if getattr(self, pm) is not None:
-                if packets[i]:
-                    self._parameters += [*getattr(self, pm)]
-                else:
-                    self._parameters += [getattr(self, pm)]
-            else:
-                break
+        tail = () if self.r_bear is None else (self.r_bear,)
+        self._parameters = (self.op_type, self._tag, self.k1, self.k2, self.sig_act, self.beta,
+                            self.eps_slip, self.eps_bear) + tail
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -1639,6 +1605,7 @@ class Viscous(UniaxialMaterialBase):
     This command is used to construct a uniaxial viscous material object. stress =C(strain-rate)^alpha
     """
     op_type = 'Viscous'
+    __slots__ = ('osi', 'big_c', 'alpha', 'built', '_parameters')
 
     def __init__(self, osi, big_c, alpha):
         """
@@ -1664,7 +1631,7 @@ class Viscous(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.big_c, self.alpha]
+        self._parameters = (self.op_type, self._tag, self.big_c, self.alpha)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -1688,6 +1655,8 @@ class BoucWen(UniaxialMaterialBase):
     extension of the original Bouc-Wen model that includes stiffness and strength degradation (Baber and Noori (1985)).
     """
     op_type = 'BoucWen'
+    __slots__ = ('osi', 'alpha', 'ko', 'n', 'gamma', 'beta', 'ao', 'delta_a', 'delta_nu', 'delta_eta',
+                 'built', '_parameters')
 
     def __init__(self, osi, alpha, ko, n, gamma, beta, ao, delta_a, delta_nu, delta_eta):
         """
@@ -1725,19 +1694,13 @@ class BoucWen(UniaxialMaterialBase):
         >>> o3.uniaxial_material.BoucWen(osi, alpha=1.0, ko=1.0, n=1.0, gamma=1.0, beta=1.0, ao=1.0, delta_a=1.0, delta_nu=1.0, delta_eta=1.0)
         """
         self.osi = osi
-        self.alpha = float(alpha)
-        self.ko = float(ko)
-        self.n = float(n)
-        self.gamma = float(gamma)
-        self.beta = float(beta)
-        self.ao = float(ao)
-        self.delta_a = float(delta_a)
-        self.delta_nu = float(delta_nu)
-        self.delta_eta = float(delta_eta)
+        pms = [float(x) for x in (alpha, ko, n, gamma, beta, ao, delta_a, delta_nu, delta_eta)]
+        (self.alpha, self.ko, self.n, self.gamma, self.beta, self.ao, self.delta_a, self.delta_nu,
+         self.delta_eta) = pms
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.alpha, self.ko, self.n, self.gamma, self.beta, self.ao, self.delta_a, self.delta_nu, self.delta_eta]
+        self._parameters = (self.op_type, self._tag, *pms)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -1779,6 +1742,8 @@ class BWBN(UniaxialMaterialBase):
     extension of the original Bouc-Wen model that includes pinching (Baber and Noori (1986) and Foliente (1995)).
     """
     op_type = 'BWBN'
+    __slots__ = ('osi', 'alpha', 'ko', 'n', 'gamma', 'beta', 'ao', 'q', 'zetas', 'p', 'shi',
+                 'delta_shi', 'lamb', 'tol', 'max_iter', 'built', '_parameters')
 
     def __init__(self, osi, alpha, ko, n, gamma, beta, ao, q, zetas, p, shi, delta_shi, lamb, tol, max_iter):
         """
@@ -1826,24 +1791,14 @@ class BWBN(UniaxialMaterialBase):
         >>> o3.uniaxial_material.BWBN(osi, alpha=1.0, ko=1.0, n=1.0, gamma=1.0, beta=1.0, ao=1.0, q=1.0, zetas=1.0, p=1.0, shi=1.0, delta_shi=1.0, lamb=1.0, tol=1.0, max_iter=1.0)
         """
         self.osi = osi
-        self.alpha = float(alpha)
-        self.ko = float(ko)
-        self.n = float(n)
-        self.gamma = float(gamma)
-        self.beta = float(beta)
-        self.ao = float(ao)
-        self.q = float(q)
-        self.zetas = float(zetas)
-        self.p = float(p)
-        self.shi = float(shi)
-        self.delta_shi = float(delta_shi)
-        self.lamb = float(lamb)
-        self.tol = float(tol)
-        self.max_iter = float(max_iter)
+        pms = [float(x) for x in (alpha, ko, n, gamma, beta, ao, q, zetas, p, shi, delta_shi,
+                                  lamb, tol, max_iter)]
+        (self.alpha, self.ko, self.n, self.gamma, self.beta, self.ao, self.q, self.zetas, self.p,
+         self.shi, self.delta_shi, self.lamb, self.tol, self.max_iter) = pms
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.alpha, self.ko, self.n, self.gamma, self.beta, self.ao, self.q, self.zetas, self.p, self.shi, self.delta_shi, self.lamb, self.tol, self.max_iter]
+        self._parameters = (self.op_type, self._tag, *pms)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -1858,6 +1813,7 @@ class AxialSp(UniaxialMaterialBase):
     stress-strain curve of elastomeric bearings.
     """
     op_type = 'AxialSp'
+    __slots__ = ('osi', 'sce', 'fty', 'fcy', 'bte', 'bty', 'bcy', 'fcr', 'built', '_parameters')
 
     def __init__(self, osi, sce, fty, fcy, bte, bty, bcy, fcr):
         """
@@ -1891,22 +1847,49 @@ class AxialSp(UniaxialMaterialBase):
         >>> o3.uniaxial_material.AxialSp(osi, sce=1.0, fty=1.0, fcy=1.0, bte=1.0, bty=1.0, bcy=1.0, fcr=1.0)
         """
         self.osi = osi
-        self.sce = float(sce)
-        self.fty = float(fty)
-        self.fcy = float(fcy)
-        self.bte = float(bte)
-        self.bty = float(bty)
-        self.bcy = float(bcy)
-        self.fcr = float(fcr)
+        pms = [float(x) for x in (sce, fty, fcy, bte, bty, bcy, fcr)]
+        (self.sce, self.fty, self.fcy, self.bte, self.bty, self.bcy, self.fcr) = pms
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.sce, self.fty, self.fcy, self.bte, self.bty, self.bcy, self.fcr]
+        self._parameters = (self.op_type, self._tag, *pms)
         if osi is None:
             self.built = 0
         if osi is not None:
             self.to_process(osi)
 
+    @classmethod
+    def batch(cls, osi, sce, fty, fcy, bte, bty, bcy, fcr):
+        """
+        Build a list of AxialSp materials from equal-length parameter sequences
+
+        Parameters
+        ----------
+        osi: o3seespy.OpenSeesInstance
+        sce: array_like
+            Values per material (see ``__init__`` for the parameter meanings)
+        fty: array_like
+        fcy: array_like
+        bte: array_like
+        bty: array_like
+        bcy: array_like
+        fcr: array_like
+
+        Returns
+        -------
+        list of AxialSp
+        """
+        # numpy arrays: unbox each column to plain floats once, outside the per-material loop
+        cols = [x.tolist() if hasattr(x, 'tolist') else x for x in (sce, fty, fcy, bte, bty, bcy, fcr)]
+        mats = [cls(None, *row) for row in zip(*cols)]
+        for mat, tag in zip(mats, osi.reserve_mat_tags(len(mats))):  # one counter increment for the whole batch
+            mat.osi = osi
+            mat._tag = tag
+            mat._parameters = (cls.op_type, tag) + mat._parameters[2:]
+            mat.to_process(osi)
+            mat.built = 1
+        return mats
+
 
 class AxialSpHD(UniaxialMaterialBase):
     """
@@ -1916,6 +1899,7 @@ class AxialSpHD(UniaxialMaterialBase):
     stress-strain curve of elastomeric bearings including hardening behavior.
     """
     op_type = 'AxialSpHD'
+    __slots__ = ('osi', 'sce', 'fty', 'fcy', 'bte', 'bty', 'bth', 'bcy', 'fcr', 'ath', 'built', '_parameters')
 
     def __init__(self, osi, sce, fty, fcy, bte, bty, bth, bcy, fcr, ath):
         """
@@ -1954,19 +1938,13 @@ class AxialSpHD(UniaxialMaterialBase):
         >>> o3.uniaxial_material.AxialSpHD(osi, sce=1.0, fty=1.0, fcy=1.0, bte=1.0, bty=1.0, bth=1.0, bcy=1.0, fcr=1.0, ath=1.0)
         """
         self.osi = osi
-        self.sce = float(sce)
-        self.fty = float(fty)
-        self.fcy = float(fcy)
-        self.bte = float(bte)
-        self.bty = float(bty)
-        self.bth = float(bth)
-        self.bcy = float(bcy)
-        self.fcr = float(fcr)
-        self.ath = float(ath)
+        pms = [float(x) for x in (sce, fty, fcy, bte, bty, bth, bcy, fcr, ath)]
+        (self.sce, self.fty, self.fcy, self.bte, self.bty, self.bth, self.bcy, self.fcr,
+         self.ath) = pms
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.sce, self.fty, self.fcy, self.bte, self.bty, self.bth, self.bcy, self.fcr, self.ath]
+        self._parameters = (self.op_type, self._tag, *pms)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -1984,6 +1962,8 @@ class CFSWSWP(UniaxialMaterialBase):
     strength and displacement, respectively.
     """
     op_type = 'CFSWSWP'
+    __slots__ = ('osi', 'height', 'width', 'fut', 'tf', 'ife', 'ifi', 'ts', 'np', 'ds', 'vs', 'sc',
+                 'nc', 'otype', 'opening_area', 'opening_length', 'built', '_parameters')
 
     def __init__(self, osi, height, width, fut, tf, ife, ifi, ts, np, ds, vs, sc, nc, otype, opening_area, opening_length):
         """
@@ -2030,25 +2010,17 @@ class CFSWSWP(UniaxialMaterialBase):
         >>> o3.uniaxial_material.CFSWSWP(osi, height=1.0, width=1.0, fut=1.0, tf=1.0, ife=1.0, ifi=1.0, ts=1.0, np=1.0, ds=1.0, vs=1.0, sc=1.0, nc=1.0, otype=1, opening_area=1.0, opening_length=1.0)
         """
         self.osi = osi
-        self.height = float(height)
-        self.width = float(width)
-        self.fut = float(fut)
-        self.tf = float(tf)
-        self.ife = float(ife)
-        self.ifi = float(ifi)
-        self.ts = float(ts)
-        self.np = float(np)
-        self.ds = float(ds)
-        self.vs = float(vs)
-        self.sc = float(sc)
-        self.nc = float(nc)
+        pms = [float(x) for x in (height, width, fut, tf, ife, ifi, ts, np, ds, vs, sc, nc)]
+        (self.height, self.width, self.fut, self.tf, self.ife, self.ifi, self.ts, self.np, self.ds,
+         self.vs, self.sc, self.nc) = pms
         self.otype = int(otype)
         self.opening_area = float(opening_area)
         self.opening_length = float(opening_length)
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.height, self.width, self.fut, self.tf, self.ife, self.ifi, self.ts, self.np, self.ds, self.vs, self.sc, self.nc, self.otype, self.opening_area, self.opening_length]
+        self._parameters = (self.op_type, self._tag, *pms, self.otype, self.opening_area,
+                            self.opening_length)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -2066,6 +2038,8 @@ class CFSSSWP(UniaxialMaterialBase):
     strength and displacement, respectively.
     """
     op_type = 'CFSSSWP'
+    __slots__ = ('osi', 'height', 'width', 'fuf', 'fyf', 'tf', 'af', 'fus', 'fys', 'ts', 'np', 'ds',
+                 'vs', 'sc', 'dt', 'opening_area', 'opening_length', 'built', '_parameters')
 
     def __init__(self, osi, height, width, fuf, fyf, tf, af, fus, fys, ts, np, ds, vs, sc, dt, opening_area, opening_length):
         """
@@ -2114,26 +2088,14 @@ class CFSSSWP(UniaxialMaterialBase):
         >>> o3.uniaxial_material.CFSSSWP(osi, height=1.0, width=1.0, fuf=1.0, fyf=1.0, tf=1.0, af=1.0, fus=1.0, fys=1.0, ts=1.0, np=1.0, ds=1.0, vs=1.0, sc=1.0, dt=1.0, opening_area=1.0, opening_length=1.0)
         """
         self.osi = osi
-        self.height = float(height)
-        self.width = float(width)
-        self.fuf = float(fuf)
-        self.fyf = float(fyf)
-        self.tf = float(tf)
-        self.af = float(af)
-        self.fus = float(fus)
-        self.fys = float(fys)
-        self.ts = float(ts)
-        self.np = float(np)
-        self.ds = float(ds)
-        self.vs = float(vs)
-        self.sc = float(sc)
-        self.dt = float(dt)
-        self.opening_area = float(opening_area)
-        self.opening_length = float(opening_length)
+        pms = [float(x) for x in (height, width, fuf, fyf, tf, af, fus, fys, ts, np, ds, vs, sc, dt,
+                                  opening_area, opening_length)]
+        (self.height, self.width, self.fuf, self.fyf, self.tf, self.af, self.fus, self.fys, self.ts,
+         self.np, self.ds, self.vs, self.sc, self.dt, self.opening_area, self.opening_length) = pms
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.height, self.width, self.fuf, self.fyf, self.tf, self.af, self.fus, self.fys, self.ts, self.np, self.ds, self.vs, self.sc, self.dt, self.opening_area, self.opening_length]
+        self._parameters = (self.op_type, self._tag, *pms)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -9,6 +9,7 @@ class Elastic(UniaxialMaterialBase):
     This command is used to construct an elastic uniaxial material object.
     """
     op_type = 'Elastic'
+    __slots__ = ('osi', 'e_mod', 'eta', 'eneg', 'built', '_parameters')
 
     def __init__(self, osi, e_mod, eta=0.0, eneg: float=None):
         """
@@ -40,17 +41,8 @@ class Elastic(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.e_mod, self.eta]
-        special_pms = ['eneg']
-        packets = [False]
-        for i, pm in enumerate(special_pms):
-            if getattr(self, pm) is not None:
-                if packets[i]:
-                    self._parameters += [*getattr(self, pm)]
-                else:
-                    self._parameters += [getattr(self, pm)]
-            else:
-                break
+        tail = () if self.eneg is None else (self.eneg,)
+        self._parameters = (self.op_type, self._tag, self.e_mod, self.eta) + tail
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -76,6 +68,7 @@ class ElasticPP(UniaxialMaterialBase):
     This command is used to construct an elastic perfectly-plastic uniaxial material object.
     """
     op_type = 'ElasticPP'
+    __slots__ = ('osi', 'e_mod', 'epsy_p', 'epsy_n', 'eps0', 'built', '_parameters')
 
     def __init__(self, osi, e_mod, epsy_p, epsy_n: float=None, eps0=0.0):
         """
@@ -111,17 +104,10 @@ class ElasticPP(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.e_mod, self.epsy_p]
-        special_pms = ['epsy_n', 'eps0']
-        packets = [False, False]
-        for i, pm in enumerate(special_pms):
-            if getattr(self, pm) is not None:
-                if packets[i]:
-                    self._parameters += [*getattr(self, pm)]
-                else:
-                    self._parameters += [getattr(self, pm)]
-            else:
-                break
+        tail = (self.epsy_n, self.eps0)
+        if None in tail:
+            tail = tail[:tail.index(None)]  # trailing parameters can only be set if all preceding ones are set
+        self._parameters = (self.op_type, self._tag, self.e_mod, self.epsy_p) + tail
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -144,6 +130,7 @@ class ElasticPPGap(UniaxialMaterialBase):
     This command is used to construct an elastic perfectly-plastic gap uniaxial material object.
     """
     op_type = 'ElasticPPGap'
+    __slots__ = ('osi', 'e_mod', 'fy', 'gap', 'eta', 'damage', 'built', '_parameters')
 
     def __init__(self, osi, e_mod, fy, gap, eta=0.0, damage='noDamage'):
         """
@@ -179,7 +166,7 @@ class ElasticPPGap(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.e_mod, self.fy, self.gap, self.eta, self.damage]
+        self._parameters = (self.op_type, self._tag, self.e_mod, self.fy, self.gap, self.eta, self.damage)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -193,6 +180,7 @@ class ENT(UniaxialMaterialBase):
     This command is used to construct a uniaxial elastic-no tension material object.
     """
     op_type = 'ENT'
+    __slots__ = ('osi', 'e_mod', 'built', '_parameters')
 
     def __init__(self, osi, e_mod):
         """
@@ -215,7 +203,7 @@ class ENT(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, self.e_mod]
+        self._parameters = (self.op_type, self._tag, self.e_mod)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -233,6 +221,7 @@ class Parallel(UniaxialMaterialBase):
     previously-constructed UniaxialMaterial objects.
     """
     op_type = 'Parallel'
+    __slots__ = ('osi', 'mats', 'factor_args', 'built', '_parameters')
 
     def __init__(self, osi, mats, factor_args: list=None):
         """
@@ -262,9 +251,10 @@ class Parallel(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, *self.mats]
-        if getattr(self, 'factor_args') is not None:
-            self._parameters += ['-factors', *self.factor_args]
+        if self.factor_args is None:
+            self._parameters = (self.op_type, self._tag, *self.mats)
+        else:
+            self._parameters = (self.op_type, self._tag, *self.mats, '-factors', *self.factor_args)
         if osi is None:
             self.built = 0
         if osi is not None:
@@ -279,6 +269,7 @@ class Series(UniaxialMaterialBase):
     UniaxialMaterial objects.
     """
     op_type = 'Series'
+    __slots__ = ('osi', 'mats', 'built', '_parameters')
 
     def __init__(self, osi, mats):
         """
@@ -303,7 +294,7 @@ class Series(UniaxialMaterialBase):
         if osi is not None:
             osi.n_mat += 1
             self._tag = osi.n_mat
-        self._parameters = [self.op_type, self._tag, *self.mats]
+        self._parameters = (self.op_type, self._tag, *self.mats)
         if osi is None:
             self.built = 0
         if osi is not None:
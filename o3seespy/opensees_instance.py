@@ -64,6 +64,17 @@ class OpenSeesInstance(object):  # TODO: allow custom (self compiled opensees)
         elif self._state == 3:
             self.commands.append(f"opy.model('basic', '-ndm', {ndm}, '-ndf', {ndf})")
 
+    def reserve_mat_tags(self, n):
+        """
+        Reserve a contiguous range of material tags with a single counter increment
+
+        Bulk-creation helpers can assign tags from the returned range instead of
+        incrementing `n_mat` once per material.
+        """
+        start = self.n_mat + 1
+        self.n_mat += n
+        return range(start, start + n)
+
     def to_commands(self, os_command):
         self.commands.append(os_command)
 
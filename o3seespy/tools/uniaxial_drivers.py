@@ -115,18 +115,23 @@ def run_uniaxial_force_driver(osi, mat_obj, forces, d_step=0.001, max_steps=1000
 
     diffs = np.diff(forces, prepend=0)
     orys = np.where(diffs >= 0, 1, -1)
+    # bind to local names to avoid module lookups in the per-step loop
+    analyze = o3.analyze
+    gen_reactions = o3.gen_reactions
+    get_ele_response = o3.get_ele_response
+    get_node_disp = o3.get_node_disp
     for i in range(len(forces)):
         ory = orys[i]
         o3.integrator.DisplacementControl(osi, right_node, o3.cc.X, -d_step * ory)
         for j in range(max_steps):
             if react * ory < forces[i] * ory:
-                o3.analyze(osi, 1)
+                analyze(osi, 1)
             else:
                 break
-            o3.gen_reactions(osi)
-            react = o3.get_ele_response(osi, ele, 'force')[0]
+            gen_reactions(osi)
+            react = get_ele_response(osi, ele, 'force')[0]
             reacts.append(react)
-            end_disp = -o3.get_node_disp(osi, right_node, dof=o3.cc.X)
+            end_disp = -get_node_disp(osi, right_node, dof=o3.cc.X)
             disp.append(end_disp)
         if j == max_steps - 1:
             if handle == 'silent':
@@ -54,3 +54,13 @@ def test_add_fixity_to_dof():
     o3.add_fixity_to_dof(osi, o3.cc.DOF2D_ROTZ, [n1])
 
 
+
+
+def test_reserve_mat_tags():
+    osi = o3.OpenSeesInstance(ndm=2)
+    mat = o3.uniaxial_material.Elastic(osi, 1.0)
+    tags = osi.reserve_mat_tags(3)
+    assert list(tags) == [mat.tag + 1, mat.tag + 2, mat.tag + 3]
+    assert osi.n_mat == mat.tag + 3
+    mat2 = o3.uniaxial_material.Elastic(osi, 1.0)
+    assert mat2.tag == mat.tag + 4  # materials built later skip the reserved range
@@ -45,3 +45,14 @@ def test_build_regular_node_mesh_2dxz():
     assert sn.shape[2] == 2  # x-axis
     assert sn[2][0][1].x == 3.0
 
+
+
+def test_build_nodes_from_coords():
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2)
+    coords = np.array([[0.0, 0.0], [1.5, 0.0], [1.5, 2.0], [0.0, 2.0]])
+    nodes = o3.node.build_nodes_from_coords(osi, coords)
+    assert len(nodes) == 4
+    assert [x.tag for x in nodes] == [1, 2, 3, 4]
+    assert nodes[2].x == 1.5
+    assert nodes[2].y == 2.0
+    assert osi.n_node == 4
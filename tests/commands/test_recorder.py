@@ -0,0 +1,42 @@
+import numpy as np
+import o3seespy as o3
+
+
+def _record_node_disp(dofs):
+    osi = o3.OpenSeesInstance(ndm=2, ndf=2, state=0)
+    left_node = o3.node.Node(osi, 0, 0)
+    right_node = o3.node.Node(osi, 0, 0)
+    o3.Fix2DOF(osi, left_node, o3.cc.FIXED, o3.cc.FIXED)
+    o3.Fix2DOF(osi, right_node, o3.cc.FREE, o3.cc.FIXED)
+    mat = o3.uniaxial_material.Elastic(osi, 1.0e3)
+    o3.element.ZeroLength(osi, [left_node, right_node], mats=[mat], dirs=[o3.cc.DOF2D_X])
+
+    o3.constraints.Plain(osi)
+    o3.numberer.RCM(osi)
+    o3.system.BandGeneral(osi)
+    o3.test_check.NormDispIncr(osi, 0.002, 10, p_flag=0)
+    o3.algorithm.Newton(osi)
+    o3.integrator.DisplacementControl(osi, right_node, o3.cc.X, 0.01)
+    o3.analysis.Static(osi)
+    ts = o3.time_series.Linear(osi, factor=1)
+    o3.pattern.Plain(osi, ts)
+    o3.Load(osi, right_node, [1.0, 0.0])
+
+    na_text = o3.recorder.NodeToArrayCache(osi, right_node, dofs, 'disp')
+    na_binary = o3.recorder.NodeToArrayCache(osi, right_node, dofs, 'disp', binary=True)
+    o3.analyze(osi, 10)
+    o3.wipe(osi)
+    return na_text.collect(), na_binary.collect()
+
+
+def test_node_to_array_cache_binary_matches_text_single_dof():
+    text, binary = _record_node_disp([o3.cc.X])
+    assert binary.shape == text.shape
+    assert np.allclose(binary, text)
+
+
+def test_node_to_array_cache_binary_matches_text_multi_dof():
+    text, binary = _record_node_disp([o3.cc.X, o3.cc.Y])
+    assert binary.shape == text.shape
+    assert binary.shape[1] == 2
+    assert np.allclose(binary, text)
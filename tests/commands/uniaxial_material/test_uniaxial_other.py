@@ -170,3 +170,22 @@ def test_cfssswp():
     osi = o3.OpenSeesInstance(ndm=2)
     o3.uniaxial_material.CFSSSWP(osi, height=1.0, width=1.0, fuf=1.0, fyf=1.0, tf=1.0, af=1.0, fus=1.0, fys=1.0, ts=1.0, np=1.0, ds=1.0, vs=1.0, sc=1.0, dt=1.0, opening_area=1.0, opening_length=1.0)
 
+
+
+def test_axial_sp_batch():
+    import numpy as np
+    osi = o3.OpenSeesInstance(ndm=2)
+    n_mat_init = osi.n_mat
+    sce = np.array([1000.0, 2000.0])
+    fty = np.array([1.0, 2.0])
+    fcy = np.array([-1.0, -2.0])
+    bte = np.array([0.5, 0.6])
+    bty = np.array([0.4, 0.5])
+    bcy = np.array([0.3, 0.4])
+    fcr = np.array([-0.5, -0.6])
+    mats = o3.uniaxial_material.AxialSp.batch(osi, sce, fty, fcy, bte, bty, bcy, fcr)
+    assert len(mats) == 2
+    assert [x.tag for x in mats] == [n_mat_init + 1, n_mat_init + 2]
+    assert osi.n_mat == n_mat_init + 2
+    assert mats[1].parameters == ('AxialSp', mats[1].tag, 2000.0, 2.0, -2.0, 0.6, 0.5, 0.4, -0.6)
+    assert mats[0].built == 1
@@ -0,0 +1,21 @@
+import o3seespy as o3
+
+
+def test_to_dict_exports_slot_attributes():
+    mat = o3.uniaxial_material.Viscous(None, big_c=1.5, alpha=2.0)
+    out = mat.to_dict()
+    assert out['big_c'] == 1.5
+    assert out['alpha'] == 2.0
+    assert '_parameters' not in out  # private attributes are not exported
+    assert '_tag' not in out
+
+
+def test_to_dict_skips_none_slot_attributes():
+    mat = o3.uniaxial_material.ElasticBilin(None, ep1=1.0, ep2=2.0, eps_p2=0.5)
+    out = mat.to_dict()
+    assert out['ep1'] == 1.0
+    assert out['ep2'] == 2.0
+    assert out['eps_p2'] == 0.5
+    assert 'en1' not in out
+    out = mat.to_dict(export_none=True)
+    assert out['en1'] is None